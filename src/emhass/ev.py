@@ -10,14 +10,74 @@ constraints, and range calculations.
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
 
+from emhass.ev_kernels import rollout_soc, rollout_soc_scenarios
+
 if TYPE_CHECKING:
     pass
 
+# plant_conf keys holding the per-EV parameters, in EVManager storage order
+_EV_PARAMETER_KEYS = (
+    "ev_battery_capacity",
+    "ev_charging_efficiency",
+    "ev_nominal_charging_power",
+    "ev_minimum_charging_power",
+    "ev_consumption_efficiency",
+)
+# Parameters used as divisors when the conversion coefficients are precomputed
+_POSITIVE_EV_PARAMETER_KEYS = ("ev_battery_capacity", "ev_consumption_efficiency")
+
+
+@dataclass(slots=True)
+class _EVConfig:
+    """Snapshot of the per-EV configuration parameters, one array entry per EV."""
+
+    cap: np.ndarray  # Battery capacity, Wh
+    eff: np.ndarray  # Charging efficiency, 0-1
+    nom_p: np.ndarray  # Nominal charging power, W
+    min_p: np.ndarray  # Minimum charging power, W
+    cons: np.ndarray  # Consumption, kWh/km
+
+    @classmethod
+    def from_plant_conf(
+        cls, plant_conf: dict, num_evs: int, dtype: np.dtype = np.float64
+    ) -> _EVConfig:
+        """
+        Read the EV parameters of the first ``num_evs`` vehicles from plant_conf.
+
+        :raises ValueError: If a parameter is missing or has fewer than \
+            ``num_evs`` entries, or if a battery capacity or consumption is not \
+            strictly positive
+        """
+        missing = [
+            key for key in _EV_PARAMETER_KEYS if len(plant_conf.get(key, ())) < num_evs
+        ]
+        if missing:
+            raise ValueError(
+                f"Incomplete EV configuration: {num_evs} entries required for "
+                f"{', '.join(missing)}"
+            )
+        # One (5, N) allocation for all parameters, each row is a contiguous array
+        params = np.asarray(
+            [plant_conf[key][:num_evs] for key in _EV_PARAMETER_KEYS], dtype=dtype
+        )
+        invalid = [
+            key
+            for key, row in zip(_EV_PARAMETER_KEYS, params)
+            if key in _POSITIVE_EV_PARAMETER_KEYS and not (row > 0).all()
+        ]
+        if invalid:
+            raise ValueError(
+                f"Invalid EV configuration: strictly positive values required for "
+                f"{', '.join(invalid)}"
+            )
+        return cls(*params)
+
 
 class ElectricVehicle:
     """
@@ -28,8 +88,15 @@ class ElectricVehicle:
     - Charging power constraints (min/max)
     - Energy consumption calculations
     - Range requirements management
+    
+    An ElectricVehicle is a handle onto one row of the structure-of-arrays
+    storage held by an :class:`EVManager`: all parameters and state are read
+    from and written to the manager's NumPy arrays. A vehicle created directly
+    through this constructor owns a private single-EV manager.
     """
     
+    __slots__ = ("ev_index", "logger", "_mgr", "_i")
+    
     def __init__(
         self,
         ev_index: int,
@@ -58,27 +125,84 @@ class ElectricVehicle:
         :param logger: Logger object for logging
         :type logger: logging.Logger
         """
-        self.ev_index = ev_index
-        self.battery_capacity = battery_capacity  # Wh
-        self.charging_efficiency = charging_efficiency  # 0-1
-        self.nominal_charging_power = nominal_charging_power  # W
-        self.minimum_charging_power = minimum_charging_power  # W
-        self.consumption_efficiency = consumption_efficiency  # kWh/km
-        self.logger = logger
-        
-        # State variables
-        self.soc = 0.5  # Initial SOC (0-1), default 50%
-        self.is_available = False  # Whether EV is at home and available to charge
-        self.minimum_required_soc = 0.2  # Minimum SOC requirement (0-1)
-        
-        self.logger.info(
-            f"EV {ev_index} initialized: "
-            f"Capacity={battery_capacity}Wh, "
-            f"Max Power={nominal_charging_power}W, "
-            f"Min Power={minimum_charging_power}W, "
-            f"Efficiency={charging_efficiency}, "
-            f"Consumption={consumption_efficiency}kWh/km"
+        manager = EVManager(
+            plant_conf={
+                "ev_battery_capacity": [battery_capacity],
+                "ev_charging_efficiency": [charging_efficiency],
+                "ev_nominal_charging_power": [nominal_charging_power],
+                "ev_minimum_charging_power": [minimum_charging_power],
+                "ev_consumption_efficiency": [consumption_efficiency],
+            },
+            optim_conf={"number_of_ev_loads": 1},
+            logger=logger,
         )
+        self._bind(manager, 0, ev_index)
+    
+    @classmethod
+    def _from_manager(cls, manager: EVManager, index: int) -> ElectricVehicle:
+        """Create a handle onto row ``index`` of an existing manager."""
+        index %= manager.num_evs  # Negative indices address the same rows as a list
+        ev = cls.__new__(cls)
+        ev._bind(manager, index, index)
+        return ev
+    
+    def _bind(self, manager: EVManager, index: int, ev_index: int) -> None:
+        self.ev_index = ev_index
+        self.logger = manager.logger
+        self._mgr = manager
+        self._i = index  # Row in the manager arrays
+    
+    @property
+    def battery_capacity(self) -> float:
+        """Battery capacity in Wh."""
+        return float(self._mgr._cap[self._i])
+    
+    @property
+    def charging_efficiency(self) -> float:
+        """Charging efficiency (0-1)."""
+        return float(self._mgr._eff[self._i])
+    
+    @property
+    def nominal_charging_power(self) -> float:
+        """Maximum charging power in W."""
+        return float(self._mgr._nom_power[self._i])
+    
+    @property
+    def minimum_charging_power(self) -> float:
+        """Minimum charging power in W (when charging)."""
+        return float(self._mgr._min_power[self._i])
+    
+    @property
+    def consumption_efficiency(self) -> float:
+        """Energy consumption in kWh/km."""
+        return float(self._mgr._cons[self._i])
+    
+    @property
+    def soc(self) -> float:
+        """Current state of charge (0-1)."""
+        return float(self._mgr._soc[self._i])
+    
+    @soc.setter
+    def soc(self, value: float) -> None:
+        self._mgr._soc[self._i] = value
+    
+    @property
+    def is_available(self) -> bool:
+        """Whether EV is at home and available to charge."""
+        return bool(self._mgr._avail[self._i])
+    
+    @is_available.setter
+    def is_available(self, value: bool) -> None:
+        self._mgr._avail[self._i] = value
+    
+    @property
+    def minimum_required_soc(self) -> float:
+        """Minimum SOC requirement (0-1)."""
+        return float(self._mgr._min_soc[self._i])
+    
+    @minimum_required_soc.setter
+    def minimum_required_soc(self, value: float) -> None:
+        self._mgr._min_soc[self._i] = value
     
     def set_soc(self, soc: float) -> None:
         """
@@ -91,9 +215,10 @@ class ElectricVehicle:
             self.logger.warning(
                 f"EV {self.ev_index}: Invalid SOC {soc}, clamping to [0, 1]"
             )
-            soc = max(0.0, min(1.0, soc))
-        self.soc = soc
-        self.logger.debug(f"EV {self.ev_index}: SOC set to {soc:.2%}")
+            soc = 0.0 if soc < 0.0 else 1.0
+        self._mgr._soc[self._i] = soc
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"EV {self.ev_index}: SOC set to {soc:.2%}")
     
     def get_soc(self) -> float:
         """
@@ -120,10 +245,11 @@ class ElectricVehicle:
         :param is_available: True if EV is at home and available
         :type is_available: bool
         """
-        self.is_available = is_available
-        self.logger.debug(
-            f"EV {self.ev_index}: Availability set to {is_available}"
-        )
+        self._mgr._avail[self._i] = is_available
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"EV {self.ev_index}: Availability set to {is_available}"
+            )
     
     def set_minimum_required_soc(self, soc: float) -> None:
         """
@@ -136,11 +262,12 @@ class ElectricVehicle:
             self.logger.warning(
                 f"EV {self.ev_index}: Invalid minimum SOC {soc}, clamping to [0, 1]"
             )
-            soc = max(0.0, min(1.0, soc))
-        self.minimum_required_soc = soc
-        self.logger.debug(
-            f"EV {self.ev_index}: Minimum required SOC set to {soc:.2%}"
-        )
+            soc = 0.0 if soc < 0.0 else 1.0
+        self._mgr._min_soc[self._i] = soc
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                f"EV {self.ev_index}: Minimum required SOC set to {soc:.2%}"
+            )
     
     def km_to_energy(self, distance_km: float) -> float:
         """
@@ -151,9 +278,7 @@ class ElectricVehicle:
         :return: Required energy in Wh
         :rtype: float
         """
-        energy_kwh = distance_km * self.consumption_efficiency
-        energy_wh = energy_kwh * 1000  # Convert kWh to Wh
-        return energy_wh
+        return distance_km * float(self._mgr._wh_per_km[self._i])
     
     def energy_to_km(self, energy_wh: float) -> float:
         """
@@ -164,9 +289,7 @@ class ElectricVehicle:
         :return: Available range in km
         :rtype: float
         """
-        energy_kwh = energy_wh / 1000  # Convert Wh to kWh
-        range_km = energy_kwh / self.consumption_efficiency
-        return range_km
+        return energy_wh * float(self._mgr._km_per_wh[self._i])
     
     def get_current_range(self) -> float:
         """
@@ -188,11 +311,7 @@ class ElectricVehicle:
         :return: Change in SOC (0-1)
         :rtype: float
         """
-        # Energy charged in Wh
-        energy_charged = charging_power * time_step * self.charging_efficiency
-        # Convert to SOC delta
-        soc_delta = energy_charged / self.battery_capacity
-        return soc_delta
+        return charging_power * time_step * float(self._mgr._soc_per_wh[self._i])
     
     def update_soc(self, charging_power: float, time_step: float) -> float:
         """
@@ -206,10 +325,11 @@ class ElectricVehicle:
         :rtype: float
         """
         soc_delta = self.calculate_soc_delta(charging_power, time_step)
-        new_soc = self.soc + soc_delta
+        new_soc = float(self._mgr._soc[self._i] + soc_delta)
         
         # Clamp to valid range
-        new_soc = max(0.0, min(1.0, new_soc))
+        if not 0.0 <= new_soc <= 1.0:
+            new_soc = 0.0 if new_soc < 0.0 else 1.0
         
         self.set_soc(new_soc)
         return new_soc
@@ -223,16 +343,26 @@ class ElectricVehicle:
         """
         if not self.is_available:
             return (0.0, 0.0)
-        return (self.minimum_charging_power, self.nominal_charging_power)
+        min_power, max_power = self._mgr._bounds[self._i]
+        return (float(min_power), float(max_power))
     
-    def __repr__(self) -> str:
-        """String representation of the EV."""
+    def describe(self) -> str:
+        """
+        Get a detailed description of the EV state, including its range.
+        
+        :return: Description with SOC, range and availability
+        :rtype: str
+        """
         return (
             f"ElectricVehicle(index={self.ev_index}, "
             f"SOC={self.soc:.2%}, "
             f"Range={self.get_current_range():.1f}km, "
             f"Available={self.is_available})"
         )
+    
+    def __repr__(self) -> str:
+        """String representation of the EV, kept cheap for use in logs."""
+        return f"ElectricVehicle(index={self.ev_index}, soc={self.soc:.3f})"
 
 
 class EVManager:
@@ -248,6 +378,7 @@ class EVManager:
         plant_conf: dict,
         optim_conf: dict,
         logger: logging.Logger,
+        dtype: np.dtype = np.float64,
     ) -> None:
         """
         Initialize the EV Manager.
@@ -258,13 +389,40 @@ class EVManager:
         :type optim_conf: dict
         :param logger: Logger object
         :type logger: logging.Logger
+        :param dtype: Floating point type of the EV parameter and state arrays. \
+            np.float32 halves the memory traffic of the batched and simulation \
+            methods, at a precision (~1e-7 relative) still far below SOC \
+            measurement accuracy, defaults to np.float64
+        :type dtype: np.dtype, optional
         """
         self.plant_conf = plant_conf
         self.optim_conf = optim_conf
         self.logger = logger
+        self._dtype = np.dtype(dtype)
         
         self.num_evs = optim_conf.get("number_of_ev_loads", 0)
-        self.evs: list[ElectricVehicle] = []
+        self._handles: list[ElectricVehicle | None] = []
+        
+        # Structure-of-arrays storage: one contiguous array per EV parameter or
+        # state variable, indexed by EV. ElectricVehicle handles read and write
+        # these arrays directly.
+        self._cap = np.empty(0, dtype=self._dtype)  # Battery capacity, Wh
+        self._eff = np.empty(0, dtype=self._dtype)  # Charging efficiency, 0-1
+        self._nom_power = np.empty(0, dtype=self._dtype)  # Nominal charging power, W
+        self._min_power = np.empty(0, dtype=self._dtype)  # Minimum charging power, W
+        self._cons = np.empty(0, dtype=self._dtype)  # Consumption, kWh/km
+        self._wh_per_km = np.empty(0, dtype=self._dtype)  # Consumption, Wh/km
+        self._km_per_wh = np.empty(0, dtype=self._dtype)  # Inverse consumption, km/Wh
+        self._soc_per_wh = np.empty(0, dtype=self._dtype)  # Efficiency / capacity, 1/Wh
+        self._delta_buf = np.empty(0, dtype=self._dtype)  # Scratch buffer for SOC deltas
+        self._soc = np.empty(0, dtype=self._dtype)  # State of charge, 0-1
+        self._avail = np.empty(0, dtype=bool)  # At home and available to charge
+        self._min_soc = np.empty(0, dtype=self._dtype)  # Minimum required SOC, 0-1
+        # (min_power, max_power) per EV when available, built once from the config
+        self._bounds = np.empty((0, 2), dtype=self._dtype)
+        # Horizon schedules, shape (num_evs, timesteps), allocated on first use
+        self._availability_schedule = np.ones((0, 0), dtype=bool)
+        self._range_req_km = np.zeros((0, 0), dtype=self._dtype)
         
         if self.num_evs > 0:
             self._initialize_evs()
@@ -275,39 +433,39 @@ class EVManager:
         """Initialize all EV instances based on configuration."""
         self.logger.info(f"Initializing {self.num_evs} electric vehicle(s)")
         
-        # Get configuration arrays
-        battery_capacities = self.plant_conf.get("ev_battery_capacity", [])
-        charging_efficiencies = self.plant_conf.get("ev_charging_efficiency", [])
-        nominal_powers = self.plant_conf.get("ev_nominal_charging_power", [])
-        minimum_powers = self.plant_conf.get("ev_minimum_charging_power", [])
-        consumptions = self.plant_conf.get("ev_consumption_efficiency", [])
-        
-        # Validate configuration
-        if not all([
-            len(battery_capacities) >= self.num_evs,
-            len(charging_efficiencies) >= self.num_evs,
-            len(nominal_powers) >= self.num_evs,
-            len(minimum_powers) >= self.num_evs,
-            len(consumptions) >= self.num_evs,
-        ]):
-            self.logger.error(
-                "EV configuration arrays are incomplete. "
-                f"Required {self.num_evs} entries for each parameter."
-            )
-            raise ValueError("Incomplete EV configuration")
-        
-        # Create EV instances
-        for i in range(self.num_evs):
-            ev = ElectricVehicle(
-                ev_index=i,
-                battery_capacity=battery_capacities[i],
-                charging_efficiency=charging_efficiencies[i],
-                nominal_charging_power=nominal_powers[i],
-                minimum_charging_power=minimum_powers[i],
-                consumption_efficiency=consumptions[i],
-                logger=self.logger,
-            )
-            self.evs.append(ev)
+        n = self.num_evs
+        try:
+            config = _EVConfig.from_plant_conf(self.plant_conf, n, self._dtype)
+        except ValueError as e:
+            self.logger.error(str(e))
+            raise
+        
+        self._cap = config.cap
+        self._eff = config.eff
+        self._nom_power = config.nom_p
+        self._min_power = config.min_p
+        self._cons = config.cons
+        self._wh_per_km = self._cons * 1000.0
+        self._km_per_wh = 1.0 / self._wh_per_km
+        self._soc_per_wh = self._eff / self._cap
+        self._delta_buf = np.empty(n, dtype=self._dtype)
+        self._soc = np.full(n, 0.5, dtype=self._dtype)  # Initial SOC (0-1), default 50%
+        self._avail = np.zeros(n, dtype=bool)
+        self._min_soc = np.full(n, 0.2, dtype=self._dtype)
+        self._bounds = np.stack([self._min_power, self._nom_power], axis=1)
+        self._availability_schedule = np.ones((n, 0), dtype=bool)
+        self._range_req_km = np.zeros((n, 0), dtype=self._dtype)
+        # EV handles are created on first access in get_ev
+        self._handles = [None] * n
+        
+        self.logger.info(
+            f"EVs initialized: "
+            f"Capacity={self._cap.tolist()}Wh, "
+            f"Max Power={self._nom_power.tolist()}W, "
+            f"Min Power={self._min_power.tolist()}W, "
+            f"Efficiency={self._eff.tolist()}, "
+            f"Consumption={self._cons.tolist()}kWh/km"
+        )
     
     def is_enabled(self) -> bool:
         """
@@ -327,10 +485,217 @@ class EVManager:
         :return: EV instance or None if index invalid
         :rtype: ElectricVehicle | None
         """
-        if 0 <= index < len(self.evs):
-            return self.evs[index]
-        self.logger.warning(f"Invalid EV index: {index}")
-        return None
+        if not 0 <= index < self.num_evs:
+            self.logger.warning(f"Invalid EV index: {index}")
+            return None
+        return self.view(index)
+    
+    def view(self, index: int) -> ElectricVehicle:
+        """
+        Get the EV handle for an index known to be valid, without validation.
+        
+        Handles are created on first access and reused afterwards. Use this in
+        loops over ``range(num_evs)``; use :meth:`get_ev` for untrusted indices.
+        
+        :param index: EV index (0-based, below num_evs)
+        :type index: int
+        :return: EV instance
+        :rtype: ElectricVehicle
+        """
+        ev = self._handles[index]
+        if ev is None:
+            ev = self._handles[index] = ElectricVehicle._from_manager(self, index)
+        return ev
+    
+    @property
+    def evs(self) -> list[ElectricVehicle]:
+        """All EV instances, ordered by index."""
+        return [self.view(i) for i in range(self.num_evs)]
+    
+    def get_state_arrays(self) -> dict[str, np.ndarray]:
+        """
+        Get the arrays holding the mutable state of all EVs.
+        
+        The arrays are the manager storage itself, not copies: they can be passed
+        to compiled (e.g. Numba ``@njit``) kernels, and writes to them are seen
+        by every EV handle.
+        
+        :return: Dictionary with the ``soc`` and ``minimum_required_soc`` float \
+            arrays (0-1) and the ``is_available`` bool array, one entry per EV
+        :rtype: dict[str, np.ndarray]
+        """
+        return {
+            "soc": self._soc,
+            "is_available": self._avail,
+            "minimum_required_soc": self._min_soc,
+        }
+    
+    def get_soc_array(self) -> np.ndarray:
+        """
+        Get the current SOC of all EVs.
+        
+        :return: Array of SOC values (0-1), one per EV
+        :rtype: np.ndarray
+        """
+        return self._soc.copy()
+    
+    def batch_set_soc(self, soc: np.ndarray) -> None:
+        """
+        Set the current state of charge of all EVs.
+        
+        Values outside [0, 1] are clamped; NaN is clamped to 1.0 like in
+        :meth:`ElectricVehicle.set_soc`.
+        
+        :param soc: State of charge (0-1), one entry per EV
+        :type soc: np.ndarray
+        """
+        soc = np.asarray(soc, dtype=self._dtype)
+        invalid = ~((soc >= 0.0) & (soc <= 1.0))  # True for NaN as well
+        clamped = np.clip(np.nan_to_num(soc, nan=1.0), 0.0, 1.0)
+        if invalid.any():
+            self.logger.warning(
+                f"Invalid EV SOC values {soc[invalid].tolist()}, clamping to [0, 1]"
+            )
+        self._soc[:] = clamped
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"EV SOCs set to {clamped.tolist()}")
+    
+    def batch_calculate_soc_delta(self, power_w: np.ndarray, dt: float) -> np.ndarray:
+        """
+        Calculate the SOC change of all EVs at once.
+        
+        :param power_w: Charging power in W, last axis indexed by EV
+        :type power_w: np.ndarray
+        :param dt: Time step duration in hours
+        :type dt: float
+        :return: Change in SOC (0-1), same shape as power_w
+        :rtype: np.ndarray
+        """
+        return np.multiply(power_w, dt * self._soc_per_wh)
+    
+    def batch_update_soc(self, power_w: np.ndarray, dt: float) -> np.ndarray:
+        """
+        Update the SOC of all EVs for one time step and return the new SOCs.
+        
+        :param power_w: Charging power in W, one entry per EV
+        :type power_w: np.ndarray
+        :param dt: Time step duration in hours
+        :type dt: float
+        :return: New SOC of every EV after charging (0-1)
+        :rtype: np.ndarray
+        """
+        soc = self._soc
+        delta = self._delta_buf
+        np.multiply(power_w, dt * self._soc_per_wh, out=delta)
+        np.add(soc, delta, out=soc)
+        np.clip(soc, 0.0, 1.0, out=soc)
+        return soc.copy()
+    
+    def simulate_soc(self, power_matrix: np.ndarray, dt: float) -> np.ndarray:
+        """
+        Simulate the SOC trajectory of all EVs over a horizon.
+        
+        The rollout starts from the current SOC of each EV and leaves the
+        manager state untouched.
+        
+        :param power_matrix: Charging power in W, shape (timesteps, num_evs)
+        :type power_matrix: np.ndarray
+        :param dt: Time step duration in hours
+        :type dt: float
+        :return: SOC (0-1) after each time step, shape (timesteps, num_evs)
+        :rtype: np.ndarray
+        """
+        power = self._as_power_matrix(power_matrix)
+        out = np.empty_like(power)
+        return rollout_soc(self._soc, power, self._soc_per_wh, dt, out)
+    
+    def simulate_scenarios(
+        self,
+        power_matrices: list[np.ndarray],
+        dt: float,
+        workers: int = 0,
+    ) -> list[np.ndarray]:
+        """
+        Simulate the SOC trajectory of all EVs for several independent scenarios.
+        
+        Each scenario is rolled out as in :meth:`simulate_soc`, starting from the
+        current SOC of each EV. With Numba installed, scenarios run concurrently
+        on a thread pool; otherwise they run sequentially.
+        
+        :param power_matrices: Charging power in W of each scenario, \
+            each of shape (timesteps, num_evs)
+        :type power_matrices: list[np.ndarray]
+        :param dt: Time step duration in hours
+        :type dt: float
+        :param workers: Number of parallel workers, 0 to use all CPUs, \
+            ignored without Numba, defaults to 0
+        :type workers: int, optional
+        :return: SOC (0-1) after each time step of each scenario
+        :rtype: list[np.ndarray]
+        """
+        powers = [self._as_power_matrix(power) for power in power_matrices]
+        return rollout_soc_scenarios(self._soc, powers, self._soc_per_wh, dt, workers)
+    
+    def _as_power_matrix(self, power_matrix: np.ndarray) -> np.ndarray:
+        """Convert a power schedule to a contiguous (timesteps, num_evs) array."""
+        power = np.ascontiguousarray(power_matrix, dtype=self._dtype)
+        if power.ndim != 2 or power.shape[1] != self.num_evs:
+            self.logger.error(
+                f"Power matrix shape {power.shape} does not match "
+                f"(timesteps, {self.num_evs})"
+            )
+            raise ValueError("Invalid EV power matrix shape")
+        return power
+    
+    def batch_km_to_energy(self, distance_km: np.ndarray) -> np.ndarray:
+        """
+        Convert distances in km to required energy in Wh for all EVs.
+        
+        :param distance_km: Distances in km, last axis indexed by EV
+        :type distance_km: np.ndarray
+        :return: Required energy in Wh, same shape as distance_km
+        :rtype: np.ndarray
+        """
+        return np.multiply(distance_km, self._wh_per_km)
+    
+    def batch_energy_to_km(self, energy_wh: np.ndarray) -> np.ndarray:
+        """
+        Convert energies in Wh to available range in km for all EVs.
+        
+        :param energy_wh: Energies in Wh, last axis indexed by EV
+        :type energy_wh: np.ndarray
+        :return: Available range in km, same shape as energy_wh
+        :rtype: np.ndarray
+        """
+        return np.multiply(energy_wh, self._km_per_wh)
+    
+    def batch_get_energy_level(self) -> np.ndarray:
+        """
+        Get the current energy level of all EVs in Wh.
+        
+        :return: Current energy in Wh, one entry per EV
+        :rtype: np.ndarray
+        """
+        return self._soc * self._cap
+    
+    def batch_get_range(self) -> np.ndarray:
+        """
+        Get the current available range of all EVs in km.
+        
+        :return: Available range in km, one entry per EV
+        :rtype: np.ndarray
+        """
+        return self.batch_energy_to_km(self.batch_get_energy_level())
+    
+    def get_bounds_matrix(self) -> np.ndarray:
+        """
+        Get the charging power bounds of all EVs given their current availability.
+        
+        :return: Array of shape (num_evs, 2) holding (minimum_power, maximum_power) \
+            in W per EV, zeroed for EVs that are not available
+        :rtype: np.ndarray
+        """
+        return np.where(self._avail[:, None], self._bounds, 0.0)
     
     def set_availability_schedule(
         self,
@@ -345,15 +710,17 @@ class EVManager:
         :param availability_array: Array of 0 (not available) or 1 (available)
         :type availability_array: list or np.ndarray or pd.Series
         """
-        ev = self.get_ev(ev_index)
-        if ev is None:
+        if self.get_ev(ev_index) is None:
             return
         
+        # Lists and Series are converted once here, downstream code only sees arrays
+        availability = np.asarray(availability_array, dtype=np.bool_)
+        self._prepare_schedules(availability)
         self.logger.info(
             f"EV {ev_index}: Setting availability schedule "
-            f"({len(availability_array)} timesteps)"
+            f"({availability.size} timesteps)"
         )
-        # Note: Actual availability will be set per timestep during optimization
+        self._availability_schedule[ev_index] = availability
     
     def set_range_requirements(
         self,
@@ -368,18 +735,89 @@ class EVManager:
         :param range_requirements_km: Array of minimum range in km per timestep
         :type range_requirements_km: list or np.ndarray or pd.Series
         """
-        ev = self.get_ev(ev_index)
-        if ev is None:
+        if self.get_ev(ev_index) is None:
             return
         
+        # Lists and Series are converted once here, downstream code only sees arrays
+        range_km = np.asarray(range_requirements_km, dtype=self._dtype)
+        self._prepare_schedules(range_km)
         self.logger.info(
             f"EV {ev_index}: Setting range requirements "
-            f"({len(range_requirements_km)} timesteps)"
+            f"({range_km.size} timesteps)"
         )
-        # Note: Requirements will be applied per timestep during optimization
+        self._range_req_km[ev_index] = range_km
+    
+    def _prepare_schedules(self, schedule: np.ndarray) -> None:
+        """
+        Check an incoming schedule and make sure the schedule matrices fit it.
+        
+        The (num_evs, timesteps) matrices are allocated by the first schedule
+        that is set. EVs without a schedule are available at all times and have
+        no range requirement. Later schedules must have the same number of
+        timesteps; call :meth:`reset_schedules` to change the horizon.
+        
+        :param schedule: Schedule of one EV
+        :type schedule: np.ndarray
+        :raises ValueError: If the schedule does not match the stored horizon
+        """
+        if schedule.ndim != 1:
+            self.logger.error(f"EV schedules must be one-dimensional, got shape {schedule.shape}")
+            raise ValueError("Invalid EV schedule shape")
+        num_timesteps = self._availability_schedule.shape[1]
+        if schedule.shape == (num_timesteps,):
+            return
+        if num_timesteps > 0:
+            self.logger.error(
+                f"EV schedule has {schedule.size} timesteps instead of {num_timesteps}, "
+                "call reset_schedules() to change the horizon"
+            )
+            raise ValueError("EV schedule length does not match the horizon")
+        self._availability_schedule = np.ones((self.num_evs, schedule.size), dtype=np.bool_)
+        self._range_req_km = np.zeros((self.num_evs, schedule.size), dtype=self._dtype)
+    
+    def reset_schedules(self) -> None:
+        """
+        Clear the availability and range schedules of all EVs.
+        
+        The next schedule that is set defines the new horizon length.
+        """
+        self._availability_schedule = np.ones((self.num_evs, 0), dtype=np.bool_)
+        self._range_req_km = np.zeros((self.num_evs, 0), dtype=self._dtype)
+    
+    def get_availability_matrix(self) -> np.ndarray:
+        """
+        Get the availability schedule of all EVs.
+        
+        :return: Boolean array of shape (num_evs, timesteps), True when the EV is \
+            available for charging. Empty (zero timesteps) until a schedule is set.
+        :rtype: np.ndarray
+        """
+        return self._availability_schedule
+    
+    def get_required_soc_matrix(self) -> np.ndarray:
+        """
+        Get the minimum SOC required by the range requirements of all EVs.
+        
+        :return: Array of shape (num_evs, timesteps) holding the SOC (0-1) needed \
+            to cover the required range at each timestep
+        :rtype: np.ndarray
+        """
+        return self._range_req_km * (self._wh_per_km / self._cap)[:, None]
+    
+    def describe(self) -> str:
+        """
+        Get a detailed description of every EV handled by the manager.
+        
+        :return: Description with the detailed state of each EV
+        :rtype: str
+        """
+        if not self.is_enabled():
+            return "EVManager(disabled)"
+        evs = ", ".join(ev.describe() for ev in self.evs)
+        return f"EVManager({self.num_evs} EVs: [{evs}])"
     
     def __repr__(self) -> str:
-        """String representation of the EV Manager."""
+        """String representation of the EV Manager, independent of the fleet size."""
         if not self.is_enabled():
             return "EVManager(disabled)"
-        return f"EVManager({self.num_evs} EVs: {self.evs})"
+        return f"EVManager({self.num_evs} EVs)"
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Numerical kernels for fleet-wide electric vehicle (EV) state propagation.
+
+The kernels operate on the structure-of-arrays storage of
+:class:`emhass.ev.EVManager`. They are JIT-compiled with Numba when it is
+installed (``pip install emhass[numba]``); otherwise an equivalent NumPy
+implementation, vectorized over the EVs, is used.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is an optional dependency
+    njit = None
+
+HAS_NUMBA = njit is not None
+
+
+def _rollout_soc_numpy(
+    soc: np.ndarray,
+    power: np.ndarray,
+    soc_per_wh: np.ndarray,
+    dt: float,
+    out: np.ndarray,
+) -> np.ndarray:
+    """NumPy fallback of :func:`rollout_soc`, vectorized over the EVs."""
+    current = np.array(soc, dtype=out.dtype)
+    soc_per_w = dt * soc_per_wh
+    for t in range(power.shape[0]):
+        current += power[t] * soc_per_w
+        np.clip(current, 0.0, 1.0, out=current)
+        out[t] = current
+    return out
+
+
+def _compile_rollout_soc(dtype: type, parallel: bool):
+    """Compile the SOC rollout loops, with all arithmetic done in ``dtype``."""
+    # Typed clamp bounds: float64 literals would promote float32 state to float64
+    lo = dtype(0.0)
+    hi = dtype(1.0)
+
+    def _rollout_soc_loops(soc, power, soc_per_wh, dt, out):
+        n_steps, n_evs = power.shape
+        for i in prange(n_evs):
+            current = soc[i]
+            soc_per_w = dt * soc_per_wh[i]
+            for t in range(n_steps):
+                current = min(hi, max(lo, current + power[t, i] * soc_per_w))
+                out[t, i] = current
+        return out
+
+    # The GIL is released so that scenarios can run concurrently in threads.
+    return njit(parallel=parallel, fastmath=True, nogil=True)(_rollout_soc_loops)
+
+
+if HAS_NUMBA:
+    # Threads use the serial variants: Numba's default threading layer does
+    # not support parallel kernels launched from several threads at once.
+    _NUMBA_KERNELS = {
+        (np.dtype(dtype), parallel): _compile_rollout_soc(dtype, parallel)
+        for dtype in (np.float32, np.float64)
+        for parallel in (True, False)
+    }
+else:
+    _NUMBA_KERNELS = {}
+
+
+def _rollout_kernel(dtype: np.dtype, parallel: bool = True):
+    """Get the rollout implementation for output arrays of ``dtype``."""
+    return _NUMBA_KERNELS.get((dtype, parallel), _rollout_soc_numpy)
+
+
+def rollout_soc(
+    soc: np.ndarray,
+    power: np.ndarray,
+    soc_per_wh: np.ndarray,
+    dt: float,
+    out: np.ndarray,
+) -> np.ndarray:
+    """
+    Propagate the SOC of N EVs over T time steps.
+
+    At each step the SOC is increased by the charged energy and clamped to [0, 1].
+
+    :param soc: Initial SOC (0-1), shape (N,)
+    :type soc: np.ndarray
+    :param power: Charging power in W, shape (T, N)
+    :type power: np.ndarray
+    :param soc_per_wh: SOC gained per Wh drawn, i.e. charging efficiency divided \
+        by battery capacity in Wh, shape (N,)
+    :type soc_per_wh: np.ndarray
+    :param dt: Time step duration in hours
+    :type dt: float
+    :param out: Output buffer receiving the SOC after each step, shape (T, N). \
+        Its dtype (float32 or float64) selects the precision of the computation.
+    :type out: np.ndarray
+    :return: The ``out`` buffer
+    :rtype: np.ndarray
+    """
+    kernel = _rollout_kernel(out.dtype)
+    return kernel(soc, power, soc_per_wh, out.dtype.type(dt), out)
+
+
+def _rollout_scenario(
+    soc: np.ndarray, power: np.ndarray, soc_per_wh: np.ndarray, dt: float
+) -> np.ndarray:
+    """Roll out one scenario into a new buffer with the serial kernel."""
+    out = np.empty_like(power)
+    kernel = _rollout_kernel(out.dtype, parallel=False)
+    return kernel(soc, power, soc_per_wh, out.dtype.type(dt), out)
+
+
+def rollout_soc_scenarios(
+    soc: np.ndarray,
+    powers: list[np.ndarray],
+    soc_per_wh: np.ndarray,
+    dt: float,
+    workers: int = 0,
+) -> list[np.ndarray]:
+    """
+    Propagate the SOC of N EVs for several independent power scenarios.
+
+    Scenarios are distributed over a thread pool when the Numba kernel is
+    available, since it releases the GIL. The NumPy fallback runs them
+    sequentially: its per-step array operations on a single fleet are too
+    small to gain from threads.
+
+    :param soc: Initial SOC (0-1), shape (N,), shared by all scenarios
+    :type soc: np.ndarray
+    :param powers: Charging power in W of each scenario, each of shape (T, N)
+    :type powers: list[np.ndarray]
+    :param soc_per_wh: SOC gained per Wh drawn, shape (N,)
+    :type soc_per_wh: np.ndarray
+    :param dt: Time step duration in hours
+    :type dt: float
+    :param workers: Number of parallel workers, 0 to use all CPUs, 1 to run \
+        the scenarios sequentially in the calling thread. Ignored without Numba.
+    :type workers: int
+    :return: SOC (0-1) after each time step of each scenario, shape (T, N) each
+    :rtype: list[np.ndarray]
+    """
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if not HAS_NUMBA or workers == 1 or len(powers) <= 1:
+        return [rollout_soc(soc, power, soc_per_wh, dt, np.empty_like(power)) for power in powers]
+    n = len(powers)
+    with ThreadPoolExecutor(max_workers=min(workers, n)) as pool:
+        return list(
+            pool.map(_rollout_scenario, [soc] * n, powers, [soc_per_wh] * n, [dt] * n)
+        )
@@ -381,7 +381,7 @@ class Optimization:
         soc_ev = []
         if self.ev_manager.is_enabled():
             for k in range(self.ev_manager.num_evs):
-                ev = self.ev_manager.get_ev(k)
+                ev = self.ev_manager.view(k)
                 # Charging power variable (0 to nominal power)
                 p_ev.append({
                     (i): plp.LpVariable(
@@ -1529,10 +1529,11 @@ class Optimization:
             self.logger.info(f"Adding EV constraints for {self.ev_manager.num_evs} vehicle(s)")
             
             for k in range(self.ev_manager.num_evs):
-                ev = self.ev_manager.get_ev(k)
+                ev = self.ev_manager.view(k)
                 self.logger.debug(f"Setting up constraints for EV {k}")
                 
                 # 1. SOC balance equation: SOC[i+1] = SOC[i] + (P_EV[i] * dt * efficiency) / battery_capacity
+                soc_per_w = ev.calculate_soc_delta(1.0, self.time_step)  # SOC gained per W over one step
                 for i in set_i:
                     if i == 0:
                         # Initial SOC
@@ -1545,7 +1546,7 @@ class Optimization:
                         })
                     else:
                         # SOC balance: SOC[i] = SOC[i-1] + (P_EV[i-1] * dt * eff) / capacity
-                        soc_delta = (p_ev[k][i-1] * self.time_step * ev.charging_efficiency) / ev.battery_capacity
+                        soc_delta = p_ev[k][i-1] * soc_per_w
                         constraints.update({
                             f"constraint_ev{k}_soc_balance_{i}": plp.LpConstraint(
                                 e=soc_ev[k][i] - soc_ev[k][i-1] - soc_delta,
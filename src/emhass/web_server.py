@@ -624,6 +624,17 @@ async def action_call(action_name: str):
     return await make_response(msg, status)
 
 
+def _start_new_ev_horizon(manager: EVManager, num_timesteps: int) -> None:
+    """Reset the EV schedules when a schedule for a new horizon length is posted."""
+    horizon = manager.get_availability_matrix().shape[1]
+    if horizon not in (0, num_timesteps):
+        app.logger.info(
+            f"EV schedule horizon changed from {horizon} to {num_timesteps} timesteps, "
+            "resetting all EV schedules"
+        )
+        manager.reset_schedules()
+
+
 @app.route("/action/ev-availability", methods=["POST"])
 async def ev_availability():
     """
@@ -664,6 +675,7 @@ async def ev_availability():
             return await make_response({"error": "EV optimization is not enabled"}, 400)
         
         # Set availability schedule
+        _start_new_ev_horizon(ev_manager, len(availability))
         ev_manager.set_availability_schedule(ev_index, availability)
         
         app.logger.info(f"Set EV {ev_index} availability schedule with {len(availability)} timesteps")
@@ -674,6 +686,9 @@ async def ev_availability():
             "timesteps": len(availability)
         }, 201)
         
+    except ValueError as e:
+        app.logger.error(f"Invalid EV availability: {e}")
+        return await make_response({"error": str(e)}, 400)
     except Exception as e:
         app.logger.error(f"Error setting EV availability: {e}")
         return await make_response({"error": str(e)}, 500)
@@ -719,6 +734,7 @@ async def ev_range_requirements():
             return await make_response({"error": "EV optimization is not enabled"}, 400)
         
         # Set range requirements
+        _start_new_ev_horizon(ev_manager, len(range_km))
         ev_manager.set_range_requirements(ev_index, range_km)
         
         app.logger.info(f"Set EV {ev_index} range requirements with {len(range_km)} timesteps")
@@ -729,6 +745,9 @@ async def ev_range_requirements():
             "timesteps": len(range_km)
         }, 201)
         
+    except ValueError as e:
+        app.logger.error(f"Invalid EV range requirements: {e}")
+        return await make_response({"error": str(e)}, 400)
     except Exception as e:
         app.logger.error(f"Error setting EV range requirements: {e}")
         return await make_response({"error": str(e)}, 500)
@@ -17,6 +17,7 @@ import numpy as np
 import pandas as pd
 
 from emhass.ev import ElectricVehicle, EVManager
+from emhass.ev_kernels import HAS_NUMBA
 
 
 class TestElectricVehicle(unittest.TestCase):
@@ -224,6 +225,31 @@ class TestEVManager(unittest.TestCase):
         self.assertEqual(len(manager.evs), 0)
         self.assertFalse(manager.is_enabled())
 
+    def test_initialization_incomplete_config(self):
+        """Test that missing or short configuration arrays are rejected."""
+        plant_conf = dict(self.plant_conf, ev_consumption_efficiency=[0.15])
+        del plant_conf['ev_charging_efficiency']
+        with self.assertRaises(ValueError) as context:
+            EVManager(plant_conf=plant_conf, optim_conf=self.optim_conf, logger=self.logger)
+        message = str(context.exception)
+        self.assertIn('ev_charging_efficiency', message)
+        self.assertIn('ev_consumption_efficiency', message)
+        self.assertNotIn('ev_battery_capacity', message)
+
+    def test_initialization_non_positive_config(self):
+        """Test that zero or negative capacities and consumptions are rejected."""
+        plant_conf = dict(
+            self.plant_conf,
+            ev_battery_capacity=[77000, 0],
+            ev_consumption_efficiency=[-0.15, 0.18],
+        )
+        with self.assertRaises(ValueError) as context:
+            EVManager(plant_conf=plant_conf, optim_conf=self.optim_conf, logger=self.logger)
+        message = str(context.exception)
+        self.assertIn('ev_battery_capacity', message)
+        self.assertIn('ev_consumption_efficiency', message)
+        self.assertNotIn('ev_charging_efficiency', message)
+
     def test_get_ev(self):
         """Test getting specific EV by index."""
         ev0 = self.manager.get_ev(0)
@@ -234,6 +260,17 @@ class TestEVManager(unittest.TestCase):
         self.assertEqual(ev0.ev_index, 0)
         self.assertEqual(ev1.ev_index, 1)
         
+        # Handles are created once and reused
+        self.assertIs(self.manager.get_ev(0), ev0)
+        self.assertIs(self.manager.view(1), ev1)
+        self.assertFalse(hasattr(ev0, '__dict__'))
+
+        # A negative view index caches the same handle as its positive index
+        manager = EVManager(self.plant_conf, self.optim_conf, self.logger)
+        self.assertEqual(manager.view(-1).ev_index, 1)
+        self.assertIs(manager.get_ev(1), manager.view(-1))
+        self.assertEqual(manager.get_ev(1).ev_index, 1)
+        
         # Invalid index
         ev_invalid = self.manager.get_ev(5)
         self.assertIsNone(ev_invalid)
@@ -241,14 +278,56 @@ class TestEVManager(unittest.TestCase):
     def test_set_availability_schedule(self):
         """Test setting availability schedule."""
         availability = [1, 1, 0, 0, 1]
-        # Should not raise an error
         self.manager.set_availability_schedule(0, availability)
+        
+        matrix = self.manager.get_availability_matrix()
+        self.assertEqual(matrix.shape, (2, 5))
+        self.assertEqual(matrix.dtype, bool)
+        np.testing.assert_array_equal(matrix[0], [True, True, False, False, True])
+        self.assertTrue(matrix[1].all())  # No schedule set: always available
+        
+        # Series are accepted and stored in the same matrix
+        self.manager.set_availability_schedule(1, pd.Series([0, 1, 1, 1, 0]))
+        np.testing.assert_array_equal(matrix[1], [False, True, True, True, False])
+        
+        # A different horizon length is rejected and keeps the stored schedules
+        with self.assertRaises(ValueError):
+            self.manager.set_availability_schedule(0, np.zeros(3))
+        np.testing.assert_array_equal(matrix[0], [True, True, False, False, True])
+        
+        # The horizon can be changed after an explicit reset
+        self.manager.reset_schedules()
+        self.manager.set_availability_schedule(0, np.zeros(3))
+        self.assertEqual(self.manager.get_availability_matrix().shape, (2, 3))
+        self.assertTrue(self.manager.get_availability_matrix()[1].all())
+        
+        with self.assertRaises(ValueError):
+            self.manager.set_availability_schedule(0, [[1, 0], [0, 1]])
+        with self.assertRaises(ValueError):
+            self.manager.set_availability_schedule(0, 1)
+        with self.assertRaises(ValueError):
+            self.manager.set_range_requirements(0, 100.0)
 
     def test_set_range_requirements(self):
         """Test setting range requirements."""
         ranges = [0, 100, 200, 150, 0]
-        # Should not raise an error
         self.manager.set_range_requirements(0, ranges)
+        
+        required_soc = self.manager.get_required_soc_matrix()
+        self.assertEqual(required_soc.shape, (2, 5))
+        ev0 = self.manager.get_ev(0)
+        expected = [ev0.km_to_energy(km) / ev0.battery_capacity for km in ranges]
+        np.testing.assert_allclose(required_soc[0], expected)
+        np.testing.assert_array_equal(required_soc[1], np.zeros(5))
+        
+        # Schedules of other EVs survive a rejected schedule of a different length
+        self.manager.set_availability_schedule(1, [1, 0, 1, 0, 1])
+        with self.assertRaises(ValueError):
+            self.manager.set_availability_schedule(1, [1, 1])
+        np.testing.assert_allclose(self.manager.get_required_soc_matrix()[0], expected)
+        np.testing.assert_array_equal(
+            self.manager.get_availability_matrix()[1], [True, False, True, False, True]
+        )
 
     def test_multi_vehicle_configuration(self):
         """Test that vehicles have different configurations."""
@@ -263,6 +342,155 @@ class TestEVManager(unittest.TestCase):
         self.assertEqual(ev0.nominal_charging_power, 4600)
         self.assertEqual(ev1.nominal_charging_power, 3680)
 
+    def test_ev_handles_share_manager_state(self):
+        """Test that EV handles read and write the manager arrays."""
+        self.manager.get_ev(0).set_soc(0.3)
+        self.manager.get_ev(1).set_availability(True)
+        np.testing.assert_allclose(self.manager.get_soc_array(), [0.3, 0.5])
+        self.assertFalse(self.manager.get_ev(0).is_available)
+        self.assertTrue(self.manager.get_ev(1).is_available)
+
+    def test_get_bounds_matrix(self):
+        """Test the fleet-wide charging power bounds."""
+        np.testing.assert_array_equal(self.manager.get_bounds_matrix(), np.zeros((2, 2)))
+        
+        self.manager.get_ev(1).set_availability(True)
+        bounds = self.manager.get_bounds_matrix()
+        np.testing.assert_array_equal(bounds, [[0.0, 0.0], [1150, 3680]])
+        self.assertEqual(tuple(bounds[1]), self.manager.get_ev(1).get_charging_power_bounds())
+
+    def test_get_state_arrays(self):
+        """Test that the state arrays are the live storage of the EV handles."""
+        state = self.manager.get_state_arrays()
+        self.assertEqual(state['soc'].dtype, np.float64)
+        self.assertEqual(state['is_available'].dtype, bool)
+        
+        state['soc'][1] = 0.7
+        state['is_available'][0] = True
+        state['minimum_required_soc'][:] = 0.4
+        self.assertEqual(self.manager.get_ev(1).get_soc(), 0.7)
+        self.assertTrue(self.manager.get_ev(0).is_available)
+        self.assertEqual(self.manager.get_ev(1).minimum_required_soc, 0.4)
+        
+        self.manager.get_ev(0).set_soc(0.9)
+        self.assertEqual(state['soc'][0], 0.9)
+
+    @unittest.skipUnless(HAS_NUMBA, "numba is not installed")
+    def test_state_arrays_in_njit_kernel(self):
+        """Test writing the EV state from a Numba-compiled function."""
+        from numba import njit
+
+        @njit
+        def fill(soc, avail, value):
+            for i in range(soc.shape[0]):
+                if not avail[i]:
+                    soc[i] = value
+
+        state = self.manager.get_state_arrays()
+        self.manager.get_ev(0).set_availability(True)
+        fill(state['soc'], state['is_available'], 0.25)
+        self.assertEqual(self.manager.get_ev(0).get_soc(), 0.5)
+        self.assertEqual(self.manager.get_ev(1).get_soc(), 0.25)
+
+    def test_batch_set_soc(self):
+        """Test setting the SOC of all vehicles, with clamping."""
+        with self.assertLogs(self.logger, level='WARNING'):
+            self.manager.batch_set_soc([1.2, 0.4])
+        np.testing.assert_allclose(self.manager.get_soc_array(), [1.0, 0.4])
+        
+        with self.assertNoLogs(self.logger, level='WARNING'):
+            self.manager.batch_set_soc(np.array([0.0, 0.8]))
+        self.assertEqual(self.manager.get_ev(1).get_soc(), 0.8)
+        
+        # NaN is clamped to 1.0, matching ElectricVehicle.set_soc
+        with self.assertLogs(self.logger, level='WARNING'):
+            self.manager.batch_set_soc([np.nan, 0.5])
+        np.testing.assert_array_equal(self.manager.get_soc_array(), [1.0, 0.5])
+        self.manager.get_ev(1).set_soc(np.nan)
+        self.assertEqual(self.manager.get_ev(1).get_soc(), 1.0)
+
+    def test_batch_update_soc(self):
+        """Test updating the SOC of all vehicles at once."""
+        self.manager.get_ev(0).set_soc(0.5)
+        self.manager.get_ev(1).set_soc(0.99)
+        power_w = np.array([4600, 3680])
+        
+        new_soc = self.manager.batch_update_soc(power_w, 0.5)
+        
+        expected_soc0 = 0.5 + (4600 * 0.5 * 0.9 / 77000)
+        self.assertAlmostEqual(new_soc[0], expected_soc0, places=6)
+        self.assertEqual(new_soc[1], 1.0)  # Clamped to 100%
+        # Batched and scalar paths must agree
+        self.assertAlmostEqual(self.manager.get_ev(0).get_soc(), expected_soc0, places=6)
+        self.assertEqual(self.manager.get_ev(1).get_soc(), 1.0)
+
+    def test_simulate_soc(self):
+        """Test the horizon rollout against repeated single-step updates."""
+        power = np.tile([4600.0, 3680.0], (24, 1))
+        power[::3] = 0.0
+        
+        trajectory = self.manager.simulate_soc(power, 0.5)
+        
+        self.assertEqual(trajectory.shape, (24, 2))
+        np.testing.assert_allclose(self.manager.get_soc_array(), [0.5, 0.5])  # State untouched
+        for t in range(24):
+            np.testing.assert_allclose(trajectory[t], self.manager.batch_update_soc(power[t], 0.5))
+        
+        with self.assertRaises(ValueError):
+            self.manager.simulate_soc(np.zeros((24, 3)), 0.5)
+
+    def test_simulate_scenarios(self):
+        """Test parallel scenario rollouts against sequential ones."""
+        rng = np.random.default_rng(0)
+        scenarios = [rng.uniform(0, 4600, size=(24, 2)) for _ in range(4)]
+        
+        results = self.manager.simulate_scenarios(scenarios, 0.5, workers=2)
+        
+        self.assertEqual(len(results), 4)
+        for power, result in zip(scenarios, results):
+            np.testing.assert_allclose(result, self.manager.simulate_soc(power, 0.5))
+        np.testing.assert_allclose(
+            self.manager.simulate_scenarios(scenarios, 0.5, workers=1)[2], results[2]
+        )
+
+    def test_float32_storage(self):
+        """Test single precision storage against the default double precision."""
+        manager = EVManager(
+            plant_conf=self.plant_conf,
+            optim_conf=self.optim_conf,
+            logger=self.logger,
+            dtype=np.float32,
+        )
+        self.assertEqual(manager.get_state_arrays()['soc'].dtype, np.float32)
+        self.assertIsInstance(manager.get_ev(0).get_soc(), float)
+        self.assertIsInstance(manager.get_ev(0).km_to_energy(100), float)
+        
+        power = np.tile([4600.0, 3680.0], (48, 1))
+        trajectory = manager.simulate_soc(power, 0.5)
+        self.assertEqual(trajectory.dtype, np.float32)
+        np.testing.assert_allclose(trajectory, self.manager.simulate_soc(power, 0.5), atol=1e-5)
+        
+        new_soc = manager.get_ev(0).update_soc(4600, 0.5)
+        self.assertAlmostEqual(new_soc, 0.5 + (4600 * 0.5 * 0.9 / 77000), places=6)
+
+    def test_batch_conversions(self):
+        """Test batched energy/range conversions against the scalar methods."""
+        ev0 = self.manager.get_ev(0)
+        ev1 = self.manager.get_ev(1)
+        
+        energy_wh = self.manager.batch_km_to_energy(np.array([100, 100]))
+        np.testing.assert_allclose(energy_wh, [ev0.km_to_energy(100), ev1.km_to_energy(100)])
+        
+        range_km = self.manager.batch_energy_to_km(np.array([15000, 18000]))
+        np.testing.assert_allclose(range_km, [100, 100])
+        
+        ev0.set_soc(1.0)
+        ev1.set_soc(0.5)
+        np.testing.assert_allclose(
+            self.manager.batch_get_range(),
+            [ev0.get_current_range(), ev1.get_current_range()],
+        )
+
 
 class TestEVConversions(unittest.TestCase):
     """Test energy and range conversion functions."""
@@ -393,6 +621,10 @@ class TestEVEdgeCases(unittest.TestCase):
         repr_str = repr(ev)
         self.assertIn("ElectricVehicle", repr_str)
         self.assertIn("index=0", repr_str)
+        
+        description = ev.describe()
+        self.assertIn("index=0", description)
+        self.assertIn("Range=256.7km", description)
 
     def test_manager_repr_disabled(self):
         """Test manager representation when disabled."""
@@ -422,6 +654,7 @@ class TestEVEdgeCases(unittest.TestCase):
         repr_str = repr(manager)
         self.assertIn("EVManager", repr_str)
         self.assertIn("1 EVs", repr_str)
+        self.assertIn("Range=", manager.describe())
 
 
 if __name__ == '__main__':
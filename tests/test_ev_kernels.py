@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""
+Unit tests for the EV numerical kernels module.
+"""
+
+import unittest
+
+import numpy as np
+
+from emhass.ev_kernels import _rollout_soc_numpy, rollout_soc
+
+
+class TestRolloutSoc(unittest.TestCase):
+    """Test cases for the SOC rollout kernel."""
+
+    def setUp(self):
+        """Set up a small fleet and a random power schedule."""
+        rng = np.random.default_rng(42)
+        self.soc = np.array([0.5, 0.95, 0.05])
+        self.eff = np.array([0.9, 0.85, 0.95])
+        self.cap = np.array([77000.0, 40000.0, 60000.0])
+        self.power = rng.uniform(-3000, 11000, size=(48, 3))
+        self.dt = 0.5
+
+    def _reference(self):
+        """Scalar Python reference implementation."""
+        out = np.empty_like(self.power)
+        soc = self.soc.copy()
+        for t in range(self.power.shape[0]):
+            for i in range(self.power.shape[1]):
+                delta = self.power[t, i] * self.dt * self.eff[i] / self.cap[i]
+                soc[i] = max(0.0, min(1.0, soc[i] + delta))
+                out[t, i] = soc[i]
+        return out
+
+    def test_rollout_matches_reference(self):
+        """Test the active kernel against the scalar reference."""
+        out = np.empty_like(self.power)
+        result = rollout_soc(self.soc, self.power, self.eff / self.cap, self.dt, out)
+        self.assertIs(result, out)
+        np.testing.assert_allclose(result, self._reference(), rtol=1e-12)
+
+    def test_numpy_fallback_matches_reference(self):
+        """Test the NumPy fallback against the scalar reference."""
+        out = np.empty_like(self.power)
+        _rollout_soc_numpy(self.soc, self.power, self.eff / self.cap, self.dt, out)
+        np.testing.assert_allclose(out, self._reference(), rtol=1e-12)
+        self.assertTrue(((out >= 0.0) & (out <= 1.0)).all())
+
+    def test_rollout_float32(self):
+        """Test that a float32 output buffer keeps the rollout in float32."""
+        out = np.empty(self.power.shape, dtype=np.float32)
+        rollout_soc(
+            self.soc.astype(np.float32),
+            self.power.astype(np.float32),
+            (self.eff / self.cap).astype(np.float32),
+            self.dt,
+            out,
+        )
+        self.assertEqual(out.dtype, np.float32)
+        np.testing.assert_allclose(out, self._reference(), atol=1e-5)
+
+
+if __name__ == "__main__":
+    unittest.main()
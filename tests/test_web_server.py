@@ -738,6 +738,46 @@ class TestEVEndpoints(unittest.IsolatedAsyncioTestCase):
             mock_ev0.set_soc.assert_called_once()
             mock_ev1.set_soc.assert_called_once()
 
+    @patch("emhass.web_server.app.logger")
+    async def test_ev_schedules_second_horizon(self, mock_logger):
+        """Test that posting schedules for a new horizon length replaces the old ones."""
+        ev_manager = web_server.EVManager(
+            {
+                "ev_battery_capacity": [60000, 40000],
+                "ev_charging_efficiency": [0.9, 0.9],
+                "ev_nominal_charging_power": [7400, 3700],
+                "ev_minimum_charging_power": [1400, 1400],
+                "ev_consumption_efficiency": [0.15, 0.18],
+            },
+            {"number_of_ev_loads": 2},
+            logging.getLogger("test"),
+        )
+
+        with patch("emhass.web_server.ev_manager", ev_manager):
+            for ev_index in (0, 1):
+                response = await self.client.post(
+                    "/action/ev-availability",
+                    json={"ev_index": ev_index, "availability": [1, 0, 0, 1]},
+                )
+                self.assertEqual(response.status_code, 201)
+
+            # A shorter horizon resets the stored schedules instead of failing
+            response = await self.client.post(
+                "/action/ev-range-requirements",
+                json={"ev_index": 1, "range_km": [0, 50]},
+            )
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual(ev_manager.get_availability_matrix().shape, (2, 2))
+            self.assertTrue(ev_manager.get_availability_matrix().all())
+            self.assertEqual(ev_manager.get_required_soc_matrix().shape, (2, 2))
+
+            # Malformed schedules are client errors
+            response = await self.client.post(
+                "/action/ev-availability",
+                json={"ev_index": 0, "availability": [[1, 0], [0, 1]]},
+            )
+            self.assertEqual(response.status_code, 400)
+
 
 if __name__ == "__main__":
     unittest.main()